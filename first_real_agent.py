@@ -29,22 +29,112 @@ Database Schema:
 - tickets: ticket_id, customer_email, issue, priority, status
 """
 
+import asyncio
 import os
 from dotenv import load_dotenv
 from langchain.agents import tool
+from langchain.tools import StructuredTool
 import sqlite3
-from datetime import datetime
+import threading
+import time
+import uuid
+from types import MappingProxyType
 
 # Load environment variables from .env file
 # Required: OPENAI_API_KEY for LLM functionality
 load_dotenv()
 
+# =============================================================================
+# DATABASE CONNECTIONS
+# =============================================================================
+# One persistent connection per database, opened once at import time.
+# SQLite keeps its page cache per connection, so reusing connections keeps
+# hot pages resident between tool calls instead of paying the file open and
+# cache warm-up cost on every lookup.
+
+# Connection-level tuning applied once when each connection is opened:
+# - WAL lets readers proceed while a ticket is being written
+# - synchronous=NORMAL is durable under WAL and avoids an fsync per commit
+# - temp_store/cache_size/mmap_size keep working data in memory
+_DB_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+"""
+
+def _open_connection(path: str) -> sqlite3.Connection:
+    """
+    Opens a long-lived SQLite connection tuned for the agent's workload.
+
+    Connections are shared by every tool invocation, including calls made from
+    LangChain worker threads, so same-thread checking is disabled. Writes are
+    serialized separately through _WRITE_LOCK. The statement cache keeps each
+    tool's compiled SQL around so repeat calls skip parsing and planning.
+
+    Args:
+        path (str): Filesystem path of the SQLite database
+
+    Returns:
+        sqlite3.Connection: Open connection with performance PRAGMAs applied
+    """
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=128)
+    conn.executescript(_DB_PRAGMAS)
+    conn.row_factory = sqlite3.Row  # Rows convert straight to dicts keyed by column
+    return conn
+
+_CONNS = {
+    "orders": _open_connection('orders.db'),
+    "inventory": _open_connection('inventory.db'),
+    "tickets": _open_connection('tickets.db'),
+}
+
+# SQLite allows a single writer per database; serializing writes in-process
+# keeps concurrent agent calls from contending on SQLite's file lock
+_WRITE_LOCK = threading.Lock()
+
+# Cursors are allocated once per thread and database and then reused by every
+# tool call; thread-local storage keeps concurrent callers off each other's cursor
+_CURSORS = threading.local()
+
+def _cursor(db: str) -> sqlite3.Cursor:
+    """
+    Returns the calling thread's reusable cursor for one of the _CONNS databases.
+    """
+    cursors = getattr(_CURSORS, "by_db", None)
+    if cursors is None:
+        cursors = _CURSORS.by_db = {}
+    cursor = cursors.get(db)
+    if cursor is None:
+        cursor = cursors[db] = _CONNS[db].cursor()
+    return cursor
+
+# SQL used by the tools, defined once so every call passes the identical
+# string and hits the connection's prepared statement cache
+# Column aliases match the keys returned by the tools, so a fetched
+# sqlite3.Row converts directly into the tool response
+_SQL_ORDER_STATUS = """
+    SELECT id AS order_id, status, order_date, total_amount
+    FROM orders WHERE id = ?
+"""
+_SQL_INSERT_TICKET = """
+    INSERT INTO tickets (ticket_id, customer_email, issue, priority, status)
+    VALUES (?, ?, ?, ?, 'open')
+"""
+_SQL_INVENTORY = """
+    SELECT product_id, name, quantity, next_restock_date AS next_restock
+    FROM inventory WHERE product_id = ?
+"""
+
 # =============================================================================
 # CUSTOMER SERVICE TOOLS
 # =============================================================================
 # These tools provide the core functionality for customer support operations.
 # Each tool is decorated with @tool for LangChain integration and follows
 # a consistent pattern: validate input, query database, return structured response.
+# create_support_ticket is built with StructuredTool so it can also provide a
+# native async implementation for the write path.
 
 @tool
 def check_order_status(order_id: str) -> dict:
@@ -70,25 +160,30 @@ def check_order_status(order_id: str) -> dict:
     Database Interaction:
         Queries orders.db table with columns: id, status, order_date, total_amount
         Uses parameterized queries for security and input sanitization
+        Reuses the shared orders connection so its page cache stays warm
     """
-    conn = sqlite3.connect('orders.db')
-    cursor = conn.cursor()
+    cursor = _cursor("orders")
 
-    cursor.execute("""
-        SELECT id, status, order_date, total_amount
-        FROM orders WHERE id = ?
-    """, (order_id,))
+    cursor.execute(_SQL_ORDER_STATUS, (order_id,))
 
     result = cursor.fetchone()
 
     if result:
-        return {
-            "order_id": result[0],
-            "status": result[1],
-            "order_date": result[2],
-            "total_amount": result[3]
-        }
+        return dict(result)
     return {"error": "Order not found"}
+
+# Return policies by product category, built once at import time.
+# Read-only view so the shared table cannot be mutated by callers.
+# Lookups are exact-match on the full category name: keying on a prefix such
+# as the first letter would silently give unknown categories ("cameras") a
+# real category's policy instead of the standard fallback.
+_RETURN_POLICIES = MappingProxyType({
+    "electronics": "30-day return window, must include original packaging",
+    "clothing": "60-day return window, must have tags attached",
+    "furniture": "14-day return window, assembly affects eligibility"
+})
+_DEFAULT_RETURN_POLICY = "Standard 30-day return policy applies"
+
 @tool
 def check_return_policy(product_type: str) -> str:
     """
@@ -115,14 +210,19 @@ def check_return_policy(product_type: str) -> str:
 
     Fallback: Generic 30-day policy for unrecognized product types
     """
-    policies = {
-        "electronics": "30-day return window, must include original packaging",
-        "clothing": "60-day return window, must have tags attached",
-        "furniture": "14-day return window, assembly affects eligibility"
-    }
-    return policies.get(product_type, "Standard 30-day return policy applies")
-@tool
-def create_support_ticket(customer_email: str, issue: str, priority: str) -> str:
+    return _RETURN_POLICIES.get(product_type, _DEFAULT_RETURN_POLICY)
+
+def _new_ticket_id() -> str:
+    """
+    Generates a unique ticket identifier in TKT-XXXXXXXXXXXXXXXX format.
+
+    Uses 64 random bits from uuid4 so IDs stay unique across concurrent agent
+    tasks and across processes sharing tickets.db, with no clock formatting
+    or coordination on the write path.
+    """
+    return f"TKT-{uuid.uuid4().hex[:16].upper()}"
+
+def _create_support_ticket(customer_email: str, issue: str, priority: str) -> str:
     """
     Creates a support ticket in the database for human agent follow-up.
 
@@ -140,7 +240,7 @@ def create_support_ticket(customer_email: str, issue: str, priority: str) -> str
 
     Database Interaction:
         Inserts new record into tickets.db with columns:
-        - ticket_id: Auto-generated unique identifier (TKT-YYYYMMDDHHMMSS format)
+        - ticket_id: Auto-generated unique identifier (TKT-XXXXXXXXXXXXXXXX format)
         - customer_email: Contact information for follow-up
         - issue: Full text of customer problem/request
         - priority: Urgency classification for queue management
@@ -150,18 +250,59 @@ def create_support_ticket(customer_email: str, issue: str, priority: str) -> str
         Function uses try/except in calling context - database connection errors
         are handled at the agent execution level with fallback responses
     """
-    ticket_id = f"TKT-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    ticket_id = _new_ticket_id()
 
-    # Save to database with transaction management
-    conn = sqlite3.connect('tickets.db')
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO tickets (ticket_id, customer_email, issue, priority, status)
-        VALUES (?, ?, ?, ?, 'open')
-    """, (ticket_id, customer_email, issue, priority))
-    conn.commit()
+    # Save to database with transaction management; writes are serialized
+    # across threads since the connection is shared
+    conn = _CONNS["tickets"]
+    with _WRITE_LOCK:
+        cursor = _cursor("tickets")
+        cursor.execute(_SQL_INSERT_TICKET, (ticket_id, customer_email, issue, priority))
+        conn.commit()
 
     return f"Support ticket {ticket_id} created. Team will respond within 24 hours."
+
+async def _acreate_support_ticket(customer_email: str, issue: str, priority: str) -> str:
+    """
+    Async implementation of create_support_ticket used by ainvoke()/astream().
+
+    The INSERT and commit block on SQLite, so they run in a worker thread to keep
+    the event loop serving other agent tasks. Concurrent writers still queue on
+    _WRITE_LOCK before touching the shared tickets connection.
+    """
+    return await asyncio.to_thread(_create_support_ticket, customer_email, issue, priority)
+
+create_support_ticket = StructuredTool.from_function(
+    func=_create_support_ticket,
+    coroutine=_acreate_support_ticket,
+    name="create_support_ticket"
+)
+
+def create_support_tickets_bulk(rows) -> list:
+    """
+    Creates several support tickets in a single database transaction.
+
+    Intended for batch imports and test setup where many tickets are written at
+    once. Inserting every row through one executemany() call and committing once
+    pays a single journal sync instead of one per ticket.
+
+    Args:
+        rows (iterable): (customer_email, issue, priority) tuples, one per ticket
+
+    Returns:
+        list: Generated ticket IDs, in the same order as the input rows
+
+    Error Handling:
+        The transaction is rolled back if any insert fails, so either every
+        ticket is created or none are
+    """
+    records = [(_new_ticket_id(), email, issue, priority) for email, issue, priority in rows]
+
+    conn = _CONNS["tickets"]
+    with _WRITE_LOCK, conn:
+        conn.executemany(_SQL_INSERT_TICKET, records)
+
+    return [record[0] for record in records]
 @tool
 def check_inventory(product_id: str) -> dict:
     """
@@ -193,23 +334,15 @@ def check_inventory(product_id: str) -> dict:
         Queries inventory.db table with columns: product_id, name, quantity, next_restock_date
         Uses parameterized queries for security
     """
-    conn = sqlite3.connect('inventory.db')
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT product_id, name, quantity, next_restock_date
-        FROM inventory WHERE product_id = ?
-    """, (product_id,))
+    cursor = _cursor("inventory")
+    cursor.execute(_SQL_INVENTORY, (product_id,))
 
     result = cursor.fetchone()
 
     if result:
-        return {
-            "product_id": result[0],
-            "name": result[1],
-            "in_stock": result[2] > 0,
-            "quantity": result[2],
-            "next_restock": result[3]
-        }
+        item = dict(result)
+        item["in_stock"] = item["quantity"] > 0
+        return item
     return {"error": "Product not found"}
 
 # =============================================================================
@@ -219,9 +352,15 @@ def check_inventory(product_id: str) -> dict:
 # architecture. The agent combines LLM capabilities with structured tools
 # while enforcing strict behavioral and safety guardrails.
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from langchain_openai import ChatOpenAI
-from langchain.agents import AgentExecutor, create_openai_tools_agent
+from langchain.agents import AgentExecutor
+from langchain.agents.format_scratchpad.openai_tools import format_to_openai_tool_messages
+from langchain.agents.output_parsers.openai_tools import OpenAIToolsAgentOutputParser
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain.schema import SystemMessage
+from langchain_core.runnables import RunnablePassthrough
+from langchain_core.utils.function_calling import convert_to_openai_tool
 
 # Register all available tools for the agent
 # Tools are executed based on natural language analysis and function calling
@@ -231,6 +370,10 @@ tools = [
     create_support_ticket,
     check_inventory
 ]
+
+# OpenAI function-calling schemas for the tools, derived once at import time
+# and bound to the model below; reusable by anything else that needs them
+TOOL_SCHEMAS = [convert_to_openai_tool(t) for t in tools]
 # Comprehensive system prompt with behavioral guardrails
 # This prompt establishes the AI agent's role, capabilities, and strict operational boundaries
 # Guardrails prevent common AI issues: hallucination, privacy violations, inappropriate responses
@@ -255,8 +398,11 @@ If a query is outside your defined capabilities or violates guardrails,
 politely explain limitations and create a support ticket for human resolution."""
 # Configure conversation template with memory support
 # Template structure enables multi-turn conversations and tool execution tracking
+# The system prompt is static, so it is embedded as a ready-built message rather
+# than a template: it is never re-formatted per call, and every request starts
+# with a byte-identical prefix that OpenAI's automatic prompt caching can reuse
 prompt = ChatPromptTemplate.from_messages([
-    ("system", system_prompt),
+    SystemMessage(content=system_prompt),
     MessagesPlaceholder(variable_name="chat_history", optional=True),  # Conversation memory
     ("human", "{input}"),                                             # Customer message
     MessagesPlaceholder(variable_name="agent_scratchpad")             # Tool execution trace
@@ -268,21 +414,73 @@ prompt = ChatPromptTemplate.from_messages([
 llm = ChatOpenAI(
     model="gpt-5-nano",
     temperature=0,  # Deterministic responses for reliability
+    streaming=True,  # Stream tokens so agent steps surface as soon as they arrive
     openai_api_key=os.getenv("OPENAI_API_KEY")  # Secure credential management
 )
 
 # Create the core agent with tool-calling capabilities
-# Agent combines LLM reasoning with structured tool execution
-agent = create_openai_tools_agent(llm, tools, prompt)
+# Agent combines LLM reasoning with structured tool execution. This is the
+# same pipeline create_openai_tools_agent builds, composed directly so the
+# model is bound to the precomputed TOOL_SCHEMAS
+agent = (
+    RunnablePassthrough.assign(
+        agent_scratchpad=lambda x: format_to_openai_tool_messages(x["intermediate_steps"])
+    )
+    | prompt
+    | llm.bind(tools=TOOL_SCHEMAS)
+    | OpenAIToolsAgentOutputParser()
+)
+
+# Worker threads for running independent tool calls from one model response.
+# sqlite3 releases the GIL while executing queries, so calls against different
+# databases (e.g. orders and inventory) overlap. Calls that hit the same
+# database share its _CONNS connection and are serialized by that
+# connection's mutex, so they gain nothing over running in sequence.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-tool")
+
+class ParallelToolAgentExecutor(AgentExecutor):
+    """
+    AgentExecutor that runs all tool calls from a single model response concurrently.
+
+    The stock executor performs multiple tool_calls (e.g. an order lookup plus an
+    inventory check) one after another. Here each tool call is submitted to
+    _TOOL_POOL as soon as it is planned, and the completed steps are yielded in
+    the original call order, so streaming and step consumption behave exactly as
+    before. Only calls against different databases actually run in parallel;
+    calls sharing a database queue on its single connection. The async path
+    (ainvoke/astream) already gathers tool calls concurrently and is left
+    unchanged.
+    """
+
+    def _perform_agent_action(self, name_to_tool_map, color_mapping, agent_action, run_manager=None):
+        # Defer execution to the pool; _iter_next_step resolves the futures
+        return _TOOL_POOL.submit(
+            super()._perform_agent_action, name_to_tool_map, color_mapping, agent_action, run_manager
+        )
+
+    def _iter_next_step(self, *args, **kwargs):
+        pending = []
+        for step in super()._iter_next_step(*args, **kwargs):
+            if isinstance(step, Future):
+                pending.append(step)
+            else:
+                yield step
+        for future in pending:
+            yield future.result()
+
+# Step-by-step chain tracing writes every intermediate step to stdout, so it
+# is opt-in for development: set AGENT_VERBOSE=1 to enable it
+VERBOSE = os.getenv("AGENT_VERBOSE") == "1"
 
 # Configure agent executor with operational safeguards
 # Executor manages tool execution, error handling, and iteration limits
-agent_executor = AgentExecutor(
+agent_executor = ParallelToolAgentExecutor(
     agent=agent,
     tools=tools,
-    verbose=True,                    # Detailed execution logging for debugging
+    verbose=VERBOSE,                 # Detailed execution tracing when AGENT_VERBOSE=1
     max_iterations=5,               # Prevent infinite loops in tool chains
-    handle_parsing_errors=True      # Graceful handling of malformed responses
+    handle_parsing_errors=True,     # Graceful handling of malformed responses
+    return_intermediate_steps=True  # Expose tool calls for monitoring
 )
 
 # =============================================================================
@@ -292,7 +490,22 @@ agent_executor = AgentExecutor(
 # comprehensive monitoring, metrics collection, and error tracking.
 
 import logging
-from datetime import datetime
+import re
+from array import array
+
+# Escalation keyword matcher, compiled once. Searching case-insensitively
+# avoids lowercasing a copy of every (potentially long) agent response.
+_ESCALATION_RE = re.compile(r"\btickets?\b", re.IGNORECASE)
+
+# Order status questions name the order ID directly ("where is order #12345"),
+# so the lookup can run before the model is called instead of costing an
+# extra LLM round-trip for the tool call. An explicit ID marker (#, no.,
+# number, id) is required so that "order 3 laptops" or "reorder 2 chairs"
+# never pull another customer's order into the prompt.
+_ORDER_INTENT_RE = re.compile(r"\border\s*(?:#\s*|no\.?\s*|number\s+|id\s+)(\d+)", re.IGNORECASE)
+
+# Number of most recent response times retained for latency percentiles
+RESPONSE_TIME_WINDOW = 1024
 
 class MonitoredAgent:
     """
@@ -329,8 +542,14 @@ class MonitoredAgent:
             "total_queries": 0,
             "successful_resolutions": 0,
             "escalations": 0,
-            "average_response_time": []
+            # Running totals keep the average O(1) in time and memory
+            "response_time_sum": 0.0,
+            "timed_queries": 0
         }
+        # Fixed-size ring buffer of recent response times stored as packed
+        # C doubles (8 bytes each) rather than a list of float objects
+        self.recent_response_times = array('d')
+        self._next_rt_slot = 0
     
     def setup_logging(self):
         """
@@ -365,6 +584,8 @@ class MonitoredAgent:
                 - status: "success" or "error"
                 - response: Agent's natural language response
                 - response_time: Execution time in seconds
+                - tools_used: Names of tools invoked, in call order, starting
+                  with check_order_status when the order was prefetched
                 - error: Error message if execution failed
 
         Monitoring Features:
@@ -379,44 +600,175 @@ class MonitoredAgent:
         - Maintains error context for debugging
         - Automatic error escalation with ticket creation
         """
-        start_time = datetime.now()
-        self.metrics["total_queries"] += 1
-
-        logging.info(f"Query received: {query[:100]}...")
+        start_time = self._start_query(query)
 
         try:
-            # Execute agent with input formatting
-            result = self.agent.invoke({"input": query})
+            # Stream agent execution so each tool step is consumed as soon as
+            # the agent emits it instead of after the whole chain completes
+            prefetched = self._prefetch_order(query)
+            result = self._new_result(prefetched)
+            for chunk in self.agent.stream(self._build_inputs(query, prefetched)):
+                self._merge_chunk(result, chunk)
+            return self._record_success(result, start_time)
 
-            # Calculate and track response latency
-            response_time = (datetime.now() - start_time).total_seconds()
-            self.metrics["average_response_time"].append(response_time)
+        except Exception as e:
+            return self._record_error(e)
 
-            # Analyze response for escalation indicators
-            if "ticket" in result["output"].lower():
-                self.metrics["escalations"] += 1
-                logging.warning(f"Query escalated to support ticket")
-            else:
-                self.metrics["successful_resolutions"] += 1
+    async def run_async(self, query: str, customer_id: str = None) -> dict:
+        """
+        Asynchronous variant of run() for concurrent query processing.
+
+        Agent execution is dominated by LLM network round-trips, so awaiting
+        astream() lets several queries overlap their latency on one event loop.
+        Monitoring, escalation detection and error handling match run().
+
+        Args:
+            query (str): Customer's natural language question or request
+            customer_id (str, optional): Customer identifier for tracking
 
-            logging.info(f"Query resolved in {response_time:.2f}s")
+        Returns:
+            dict: Same structure as run()
+        """
+        start_time = self._start_query(query)
 
-            return {
-                "status": "success",
-                "response": result["output"],
-                "response_time": response_time
-            }
+        try:
+            # The prefetch is a blocking SQLite call, so it runs in a worker
+            # thread to keep the event loop free for other queries
+            prefetched = await asyncio.to_thread(self._prefetch_order, query)
+            result = self._new_result(prefetched)
+            async for chunk in self.agent.astream(self._build_inputs(query, prefetched)):
+                self._merge_chunk(result, chunk)
+            return self._record_success(result, start_time)
 
         except Exception as e:
-            # Comprehensive error handling with user-friendly messages
-            logging.error(f"Agent error: {str(e)}")
-
-            return {
-                "status": "error",
-                "response": "I apologize, but I encountered an error. A support ticket has been created.",
-                "error": str(e)
-            }
-    
+            return self._record_error(e)
+
+    def _start_query(self, query: str) -> int:
+        """
+        Count and log an incoming query, returning its monotonic start time in nanoseconds.
+        """
+        self.metrics["total_queries"] += 1
+
+        logging.info("Query received: %.100s...", query)
+
+        return time.perf_counter_ns()
+
+    @staticmethod
+    def _prefetch_order(query: str):
+        """
+        Look up the order named in an order-status query ahead of the model call.
+
+        When the query names an order ID, check_order_status runs up front (a
+        sub-millisecond indexed lookup) so its result can be supplied as context
+        and the model can answer in a single round-trip instead of requesting
+        the tool and waiting for a second completion.
+
+        Returns:
+            tuple | None: (order_id, lookup result), or None if no order ID is named
+        """
+        match = _ORDER_INTENT_RE.search(query)
+        if match is None:
+            return None
+        order_id = match.group(1)
+        return order_id, check_order_status.invoke({"order_id": order_id})
+
+    @staticmethod
+    def _build_inputs(query: str, prefetched) -> dict:
+        """
+        Build agent inputs, placing any prefetched order status ahead of the customer message.
+        """
+        inputs = {"input": query}
+
+        if prefetched is not None:
+            order_id, order = prefetched
+            inputs["chat_history"] = [SystemMessage(
+                content=f"check_order_status result for order {order_id}: {order}"
+            )]
+
+        return inputs
+
+    @staticmethod
+    def _new_result(prefetched) -> dict:
+        """
+        Start an accumulated result, crediting a prefetched lookup as a tool call.
+        """
+        return {
+            "output": "",
+            "intermediate_steps": [],
+            "prefetched_tools": ["check_order_status"] if prefetched is not None else []
+        }
+
+    @staticmethod
+    def _merge_chunk(result: dict, chunk: dict) -> None:
+        """
+        Fold one AgentExecutor stream chunk into the accumulated result.
+
+        Chunks carry either planned "actions", completed tool "steps", or the
+        final "output"; only steps and output are needed for monitoring.
+        """
+        if "steps" in chunk:
+            result["intermediate_steps"].extend(chunk["steps"])
+        if "output" in chunk:
+            result["output"] = chunk["output"]
+
+    def _record_success(self, result: dict, start_time: int) -> dict:
+        """
+        Update metrics for a completed agent execution and build the response.
+
+        Args:
+            result (dict): Agent result containing "output", "intermediate_steps"
+                and "prefetched_tools"
+            start_time (int): perf_counter_ns() value returned by _start_query()
+
+        Returns:
+            dict: Success response with response text and latency
+        """
+        # Calculate and track response latency
+        response_time = (time.perf_counter_ns() - start_time) * 1e-9
+        self.metrics["response_time_sum"] += response_time
+        self.metrics["timed_queries"] += 1
+        self._record_response_time(response_time)
+
+        # Analyze response for escalation indicators
+        if _ESCALATION_RE.search(result["output"]):
+            self.metrics["escalations"] += 1
+            logging.warning("Query escalated to support ticket")
+        else:
+            self.metrics["successful_resolutions"] += 1
+
+        logging.info("Query resolved in %.2fs", response_time)
+
+        return {
+            "status": "success",
+            "response": result["output"],
+            "response_time": response_time,
+            "tools_used": result["prefetched_tools"]
+                          + [step.action.tool for step in result["intermediate_steps"]]
+        }
+
+    def _record_response_time(self, response_time: float) -> None:
+        """
+        Store a response time in the bounded window, overwriting the oldest entry once full.
+        """
+        if len(self.recent_response_times) < RESPONSE_TIME_WINDOW:
+            self.recent_response_times.append(response_time)
+        else:
+            self.recent_response_times[self._next_rt_slot] = response_time
+        self._next_rt_slot = (self._next_rt_slot + 1) % RESPONSE_TIME_WINDOW
+
+    def _record_error(self, error: Exception) -> dict:
+        """
+        Log a failed agent execution and build the user-facing error response.
+        """
+        # Comprehensive error handling with user-friendly messages
+        logging.error("Agent error: %s", error)
+
+        return {
+            "status": "error",
+            "response": "I apologize, but I encountered an error. A support ticket has been created.",
+            "error": str(error)
+        }
+
     def get_metrics(self) -> dict:
         """
         Calculate and return comprehensive performance metrics.
@@ -430,23 +782,31 @@ class MonitoredAgent:
                 - resolution_rate: Percentage of queries resolved without escalation
                 - escalation_rate: Percentage of queries requiring human intervention
                 - average_response_time: Mean response time in seconds
+                - p50_response_time: Median of recent response times in seconds
+                - p95_response_time: 95th percentile of recent response times in seconds
 
         Calculation Methods:
         - Resolution rate: (successful_resolutions / total_queries) * 100
         - Escalation rate: (escalations / total_queries) * 100
-        - Average response time: Mean of all recorded response times
+        - Average response time: response_time_sum / timed_queries (running mean)
+        - Percentiles: nearest-rank over the last RESPONSE_TIME_WINDOW response times
 
         Edge Cases:
         - Handles zero queries gracefully (returns 0 for rates)
-        - Manages empty response time arrays
+        - Handles no completed queries (returns 0 average and percentiles)
         """
-        avg_time = sum(self.metrics["average_response_time"]) / len(self.metrics["average_response_time"]) if self.metrics["average_response_time"] else 0
+        avg_time = self.metrics["response_time_sum"] / self.metrics["timed_queries"] if self.metrics["timed_queries"] else 0
+        recent = sorted(self.recent_response_times)
+        p50 = recent[(len(recent) - 1) // 2] if recent else 0
+        p95 = recent[int((len(recent) - 1) * 0.95)] if recent else 0
 
         return {
             "total_queries": self.metrics["total_queries"],
             "resolution_rate": (self.metrics["successful_resolutions"] / self.metrics["total_queries"] * 100) if self.metrics["total_queries"] > 0 else 0,
             "escalation_rate": (self.metrics["escalations"] / self.metrics["total_queries"] * 100) if self.metrics["total_queries"] > 0 else 0,
-            "average_response_time": round(avg_time, 2)
+            "average_response_time": round(avg_time, 2),
+            "p50_response_time": round(p50, 2),
+            "p95_response_time": round(p95, 2)
         }
 
 # =============================================================================
@@ -508,13 +868,15 @@ test_cases = [
     }
 ]
 
-def test_agent(test_cases):
+async def test_agent_async(test_cases):
     """
     Execute comprehensive test suite against the monitored agent.
 
     This function runs a series of predefined test cases to validate agent
     behavior, tool selection accuracy, and response quality. Results are
-    structured for analysis and debugging.
+    structured for analysis and debugging. All queries are dispatched
+    concurrently, so total wall-clock time is bounded by the slowest query
+    rather than the sum of LLM round-trips.
 
     Args:
         test_cases (list): Array of test case dictionaries with:
@@ -540,11 +902,14 @@ def test_agent(test_cases):
     - Analyze response patterns for optimization opportunities
     - Validate guardrail effectiveness across scenarios
     """
+    responses = await asyncio.gather(
+        *(monitored_agent.run_async(test['query']) for test in test_cases)
+    )
+
     results = []
 
-    for test in test_cases:
+    for test, response in zip(test_cases, responses):
         print(f"\nTesting: {test['query']}")
-        response = monitored_agent.run(test['query'])
 
         results.append({
             "query": test['query'],
@@ -560,5 +925,4 @@ def test_agent(test_cases):
 
 # Execute test suite and display results
 # This validates the complete agent implementation across all major use cases
-test_results = test_agent(test_cases)
-
+test_results = asyncio.run(test_agent_async(test_cases))
@@ -14,12 +14,47 @@ Run this script to verify your agent installation is working correctly.
 
 import sys
 import os
-import subprocess
+import collections
 import sqlite3
-import importlib
+import importlib.util
+import itertools
+import json
+import threading
 import time
-from datetime import datetime
-import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Agent components are imported once at load time; a missing dependency is
+# recorded here and reported by test_agent_functionality
+try:
+    from langchain.agents import tool, AgentExecutor, create_openai_tools_agent
+    from langchain_openai import ChatOpenAI
+    from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+    _LANGCHAIN_AVAILABLE = True
+    _LANGCHAIN_IMPORT_ERROR = None
+except ImportError as e:
+    _LANGCHAIN_AVAILABLE = False
+    _LANGCHAIN_IMPORT_ERROR = str(e)
+
+# Applied once per connection: WAL so reads don't block on writes, fewer
+# fsyncs, in-memory temp storage and a larger page cache
+_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=memory;
+    PRAGMA cache_size=-20000;
+    PRAGMA busy_timeout=5000;
+"""
+
+def _open(path, **kwargs):
+    """Open an autocommit SQLite connection with the tuning PRAGMAs applied"""
+    conn = sqlite3.connect(path, isolation_level=None, **kwargs)
+    conn.executescript(_PRAGMAS)
+    return conn
+
+# Tables the agent expects; table names cannot be bound as SQL parameters,
+# so only these are ever formatted into a statement
+_KNOWN_TABLES = frozenset({"orders", "inventory", "tickets"})
 
 class AgentInstallationTester:
     def __init__(self):
@@ -31,6 +66,34 @@ class AgentInstallationTester:
             "overall": {"passed": 0, "failed": 0, "total": 0}
         }
         self.start_time = time.time()
+        # Wall-clock anchor for the run; individual results only record a
+        # cheap monotonic offset from it, converted back to a timestamp
+        # when the results are returned (see _timestamp_of)
+        self._t0_wall = datetime.now()
+        self._t0_ns = time.monotonic_ns()
+        # Categories run concurrently: results are updated under a lock, and
+        # each category's output is collected and printed once it finishes
+        self._lock = threading.Lock()
+        self._out_buf = collections.defaultdict(list)
+        # Row counts recorded by test_databases, reused by later checks
+        self._db_counts = {}
+
+    def _emit(self, category, line):
+        """Queue a line of output for the given category"""
+        self._out_buf[category].append(line + "\n")
+
+    def _section(self, category, title):
+        """Queue a section header for the given category"""
+        self._emit(category, "\n" + "="*60)
+        self._emit(category, title)
+        self._emit(category, "="*60)
+
+    def _flush_output(self, category):
+        """Write a finished category's queued output in a single call"""
+        with self._lock:
+            sys.stdout.write("".join(self._out_buf[category]))
+            sys.stdout.flush()
+            self._out_buf[category].clear()
 
     def log_test(self, category, test_name, status, message, error=None):
         """Log a test result"""
@@ -39,26 +102,32 @@ class AgentInstallationTester:
             "status": status,
             "message": message,
             "error": error,
-            "timestamp": datetime.now().isoformat()
+            "elapsed_ns": time.monotonic_ns() - self._t0_ns
         }
 
-        self.test_results[category].append(result)
-        self.test_results["overall"]["total"] += 1
+        with self._lock:
+            self.test_results[category].append(result)
+            self.test_results["overall"]["total"] += 1
+
+            if status == "PASS":
+                self.test_results["overall"]["passed"] += 1
+            else:
+                self.test_results["overall"]["failed"] += 1
 
         if status == "PASS":
-            self.test_results["overall"]["passed"] += 1
-            print(f"[PASS] {test_name}: {message}")
+            self._emit(category, f"[PASS] {test_name}: {message}")
         else:
-            self.test_results["overall"]["failed"] += 1
-            print(f"[FAIL] {test_name}: {message}")
+            self._emit(category, f"[FAIL] {test_name}: {message}")
             if error:
-                print(f"   Error: {error}")
+                self._emit(category, f"   Error: {error}")
+
+    def _timestamp_of(self, result):
+        """Wall-clock ISO timestamp of a logged result, derived from its offset"""
+        return (self._t0_wall + timedelta(microseconds=result["elapsed_ns"] // 1000)).isoformat()
 
     def test_imports(self):
         """Test all required imports"""
-        print("\n" + "="*60)
-        print("TESTING IMPORTS")
-        print("="*60)
+        self._section("imports", "TESTING IMPORTS")
 
         # Core Python imports
         core_imports = [
@@ -69,41 +138,40 @@ class AgentInstallationTester:
             ("logging", "logging", "Standard library logging module")
         ]
 
-        for module_name, import_name, description in core_imports:
-            try:
-                module = __import__(import_name)
-                self.log_test("imports", f"Import {module_name}", "PASS",
-                            f"Successfully imported {description}")
-            except ImportError as e:
-                self.log_test("imports", f"Import {module_name}", "FAIL",
-                            f"Failed to import {description}", str(e))
-
-        # Third-party imports
+        # Third-party imports, one entry per module (symbols are exercised
+        # by test_agent_functionality)
         third_party_imports = [
-            ("langchain.agents", "langchain.agents", "LangChain agents framework"),
-            ("langchain.agents.tool", "langchain.agents", "LangChain tool decorator"),
+            ("langchain.agents", "langchain.agents", "LangChain agents framework (tool, AgentExecutor, create_openai_tools_agent)"),
             ("langchain_openai", "langchain_openai", "LangChain OpenAI integration"),
-            ("langchain.prompts", "langchain.prompts", "LangChain prompts"),
-            ("langchain.agents.AgentExecutor", "langchain.agents", "Agent executor"),
-            ("langchain.agents.create_openai_tools_agent", "langchain.agents", "OpenAI tools agent"),
-            ("langchain.prompts.ChatPromptTemplate", "langchain.prompts", "Chat prompt template"),
-            ("langchain.prompts.MessagesPlaceholder", "langchain.prompts", "Messages placeholder")
+            ("langchain.prompts", "langchain.prompts", "LangChain prompts (ChatPromptTemplate, MessagesPlaceholder)")
         ]
 
-        for module_name, import_name, description in third_party_imports:
+        # Resolve each module with find_spec rather than importing it, so the
+        # check locates the module without executing its body. Results are
+        # gathered first and reported as one summary row; only failures get
+        # their own detail row.
+        results = []
+        for module_name, import_name, description in core_imports + third_party_imports:
             try:
-                module = __import__(import_name, fromlist=[''])
-                self.log_test("imports", f"Import {module_name}", "PASS",
-                            f"Successfully imported {description}")
+                spec = importlib.util.find_spec(import_name)
+                error = None if spec else f"No module named '{import_name}'"
             except ImportError as e:
+                error = str(e)
+            results.append((module_name, description, error))
+
+        passes = sum(1 for _, _, error in results if error is None)
+        self.log_test("imports", "Imports summary",
+                    "PASS" if passes == len(results) else "FAIL",
+                    f"{passes}/{len(results)} imports ok")
+
+        for module_name, description, error in results:
+            if error is not None:
                 self.log_test("imports", f"Import {module_name}", "FAIL",
-                            f"Failed to import {description}", str(e))
+                            f"Could not find {description}", error)
 
     def test_databases(self):
         """Test database accessibility and structure"""
-        print("\n" + "="*60)
-        print("TESTING DATABASES")
-        print("="*60)
+        self._section("databases", "TESTING DATABASES")
 
         databases = [
             ("orders.db", "orders"),
@@ -112,100 +180,98 @@ class AgentInstallationTester:
         ]
 
         for db_file, table_name in databases:
-            # Test database file accessibility
-            if os.path.exists(db_file):
-                self.log_test("databases", f"Database file {db_file}", "PASS",
-                            f"Database file exists and is accessible")
-
-                # Test database connection and structure
-                try:
-                    conn = sqlite3.connect(db_file)
-                    cursor = conn.cursor()
-
-                    # Check if table exists
-                    cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'")
-                    if cursor.fetchone():
-                        self.log_test("databases", f"Table {table_name} in {db_file}", "PASS",
-                                    f"Table {table_name} exists in database")
-
-                        # Get table structure
-                        cursor.execute(f"PRAGMA table_info({table_name})")
-                        columns = cursor.fetchall()
-                        column_names = [col[1] for col in columns]
-                        self.log_test("databases", f"Table structure {table_name}", "PASS",
-                                    f"Table has columns: {', '.join(column_names)}")
-
-                        # Test sample query
-                        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                        count = cursor.fetchone()[0]
-                        self.log_test("databases", f"Query test {table_name}", "PASS",
-                                    f"Successfully queried {table_name} table (found {count} records)")
-
-                    else:
-                        self.log_test("databases", f"Table {table_name} in {db_file}", "FAIL",
-                                    f"Table {table_name} does not exist in database")
-
-                    conn.close()
-
-                except sqlite3.Error as e:
-                    self.log_test("databases", f"Database connection {db_file}", "FAIL",
-                                f"Failed to connect to or query database", str(e))
-
-            else:
+            # Test database file accessibility: open read-write without
+            # creating, so a missing file fails here without a separate stat
+            try:
+                conn = _open(f"file:{db_file}?mode=rw", uri=True)
+            except sqlite3.OperationalError as e:
                 self.log_test("databases", f"Database file {db_file}", "FAIL",
-                            f"Database file does not exist or is not accessible")
+                            f"Database file does not exist or is not accessible", str(e))
+                continue
+            except sqlite3.Error as e:
+                # The file exists but the PRAGMA script could not run on it,
+                # e.g. a corrupt file or one that is not SQLite at all
+                self.log_test("databases", f"Database connection {db_file}", "FAIL",
+                            f"Failed to connect to or query database", str(e))
+                continue
+
+            self.log_test("databases", f"Database file {db_file}", "PASS",
+                        f"Database file exists and is accessible")
+
+            # Test database connection and structure
+            try:
+                cursor = conn.cursor()
+
+                # Check if table exists and get its structure in one query:
+                # pragma_table_info returns no rows for a missing table
+                cursor.execute("SELECT name FROM pragma_table_info(?)", (table_name,))
+                first_column = cursor.fetchone()
+                if first_column:
+                    self.log_test("databases", f"Table {table_name} in {db_file}", "PASS",
+                                f"Table {table_name} exists in database")
+
+                    # Stream the remaining column rows straight into the join
+                    column_list = ", ".join(itertools.chain(first_column, (col[0] for col in cursor)))
+                    self.log_test("databases", f"Table structure {table_name}", "PASS",
+                                f"Table has columns: {column_list}")
+
+                    # Test sample query. MAX(rowid) is a single B-tree seek, unlike
+                    # COUNT(*) which scans the table; it equals the row count
+                    # unless rows have been deleted, so it is reported as approximate
+                    if table_name not in _KNOWN_TABLES:
+                        raise ValueError(f"Unexpected table name: {table_name}")
+                    cursor.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table_name}")
+                    count = cursor.fetchone()[0]
+                    self._db_counts[table_name] = count
+                    self.log_test("databases", f"Query test {table_name}", "PASS",
+                                f"Successfully queried {table_name} table (about {count} records)")
+
+                else:
+                    self.log_test("databases", f"Table {table_name} in {db_file}", "FAIL",
+                                f"Table {table_name} does not exist in database")
+
+            except (sqlite3.Error, ValueError) as e:
+                self.log_test("databases", f"Database connection {db_file}", "FAIL",
+                            f"Failed to connect to or query database", str(e))
+
+            finally:
+                conn.close()
 
     def test_virtual_environment(self):
         """Test virtual environment activation"""
-        print("\n" + "="*60)
-        print("TESTING VIRTUAL ENVIRONMENT")
-        print("="*60)
+        self._section("environment", "TESTING VIRTUAL ENVIRONMENT")
 
-        # Check if we're in a virtual environment
+        # Probe everything once and report it as a single snapshot row
         in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+        info = {
+            "in_venv": in_venv,
+            "prefix": sys.prefix,
+            "exe": sys.executable,
+            "version": sys.version.split()[0],
+            "cwd": os.getcwd(),
+            "env_file": os.path.exists('.env')
+        }
+        self.log_test("environment", "Environment Snapshot", "PASS", json.dumps(info))
 
-        if in_venv:
-            self.log_test("environment", "Virtual Environment Detection", "PASS",
-                        "Running within a virtual environment")
-            self.log_test("environment", "Virtual Environment Path", "PASS",
-                        f"Virtual environment located at: {sys.prefix}")
-        else:
+        # Only conditions worth acting on get their own readable row
+        if not in_venv:
             self.log_test("environment", "Virtual Environment Detection", "WARN",
                         "Not running within a virtual environment (may be using system Python)")
 
-        # Check Python path
-        self.log_test("environment", "Python Executable", "PASS",
-                    f"Using Python executable: {sys.executable}")
-
-        # Check Python version
-        self.log_test("environment", "Python Version", "PASS",
-                    f"Python version: {sys.version}")
-
-        # Check current working directory
-        self.log_test("environment", "Working Directory", "PASS",
-                    f"Current working directory: {os.getcwd()}")
-
-        # Check if .env file exists
-        if os.path.exists('.env'):
-            self.log_test("environment", ".env File", "PASS",
-                        ".env file exists for configuration")
-        else:
+        if not info["env_file"]:
             self.log_test("environment", ".env File", "WARN",
                         ".env file not found (may need manual configuration)")
 
     def test_agent_functionality(self):
         """Test basic agent functionality"""
-        print("\n" + "="*60)
-        print("TESTING AGENT FUNCTIONALITY")
-        print("="*60)
+        self._section("agent_functionality", "TESTING AGENT FUNCTIONALITY")
 
-        try:
-            # Import agent components
-            from langchain.agents import tool
-            from langchain_openai import ChatOpenAI
-            from langchain.agents import AgentExecutor, create_openai_tools_agent
-            from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+        if not _LANGCHAIN_AVAILABLE:
+            self.log_test("agent_functionality", "Agent Component Imports", "FAIL",
+                        "Failed to import agent components", _LANGCHAIN_IMPORT_ERROR)
+            return
 
+        try:
             self.log_test("agent_functionality", "Agent Component Imports", "PASS",
                         "Successfully imported all agent components")
 
@@ -227,25 +293,36 @@ class AgentInstallationTester:
                 self.log_test("agent_functionality", "Tool Execution", "FAIL",
                             "Test tool execution failed or returned unexpected result")
 
+            # Exercise the underlying function directly; the wrapper is
+            # already covered above, so this skips schema validation and
+            # callback setup
+            result = test_tool.func("direct_value")
+            if "direct_value" in result:
+                self.log_test("agent_functionality", "Tool Function", "PASS",
+                            "Underlying tool function executed successfully")
+            else:
+                self.log_test("agent_functionality", "Tool Function", "FAIL",
+                            "Underlying tool function returned unexpected result")
+
             # Test database tool functions (without full agent setup)
             try:
-                # Test order status check
-                conn = sqlite3.connect('orders.db')
-                cursor = conn.cursor()
-                cursor.execute('SELECT COUNT(*) FROM orders')
-                count = cursor.fetchone()[0]
-                conn.close()
+                # Test order status check, reusing the count from
+                # test_databases and only querying if it wasn't recorded
+                count = self._db_counts.get("orders")
+                if count is None:
+                    conn = sqlite3.connect('file:orders.db?mode=rw', uri=True)
+                    cursor = conn.cursor()
+                    cursor.execute('SELECT COALESCE(MAX(rowid), 0) FROM orders')
+                    count = cursor.fetchone()[0]
+                    conn.close()
 
                 self.log_test("agent_functionality", "Database Tool Access", "PASS",
-                            f"Database tools can access orders table ({count} records found)")
+                            f"Database tools can access orders table (about {count} records)")
 
             except Exception as e:
                 self.log_test("agent_functionality", "Database Tool Access", "FAIL",
                             "Database tools cannot access required tables", str(e))
 
-        except ImportError as e:
-            self.log_test("agent_functionality", "Agent Component Imports", "FAIL",
-                        "Failed to import agent components", str(e))
         except Exception as e:
             self.log_test("agent_functionality", "Agent Functionality", "FAIL",
                         "Unexpected error during agent functionality test", str(e))
@@ -254,13 +331,26 @@ class AgentInstallationTester:
         """Run all tests and provide summary"""
         print("AGENT INSTALLATION TEST SUITE")
         print("="*60)
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # Run all test categories
-        self.test_imports()
-        self.test_databases()
-        self.test_virtual_environment()
-        self.test_agent_functionality()
+        print(f"Started at: {self._t0_wall.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # Run test categories concurrently; they share no state besides the
+        # locked result counters and the database counts, which is why agent
+        # functionality runs right after the database checks on one worker.
+        # Output is printed per category, in a fixed order, as each completes.
+        def databases_then_agent():
+            self.test_databases()
+            self.test_agent_functionality()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            imports = executor.submit(self.test_imports)
+            databases = executor.submit(databases_then_agent)
+            environment = executor.submit(self.test_virtual_environment)
+            for category, future in [("imports", imports),
+                                     ("databases", databases),
+                                     ("environment", environment),
+                                     ("agent_functionality", databases)]:
+                future.result()
+                self._flush_output(category)
 
         # Calculate total time
         total_time = time.time() - self.start_time
@@ -300,6 +390,12 @@ class AgentInstallationTester:
                         if test['status'] == "FAIL":
                             print(f"  - {test['test_name']}: {test['message']}")
 
+        # Every category has finished, so timestamps are filled in once here
+        for category, tests in self.test_results.items():
+            if category != "overall":
+                for test in tests:
+                    test["timestamp"] = self._timestamp_of(test)
+
         return self.test_results
 
 def main():
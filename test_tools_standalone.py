@@ -8,25 +8,111 @@ the full agent initialization that needs OpenAI API key.
 
 import sys
 import os
+import atexit
+import contextlib
+import queue
 import sqlite3
 from datetime import datetime
 
 # Define the tools directly to avoid importing the main agent file
 from langchain.agents import tool
 
+# Applied once per connection: WAL so reads don't block on writes, fewer
+# fsyncs, in-memory temp storage and a larger page cache
+_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=memory;
+    PRAGMA cache_size=-20000;
+    PRAGMA busy_timeout=5000;
+"""
+
+def _open(path, **kwargs):
+    """Open an autocommit SQLite connection with the tuning PRAGMAs applied"""
+    # A generous statement cache keeps every tool query prepared for the
+    # lifetime of the shared connection
+    conn = sqlite3.connect(path, isolation_level=None, cached_statements=256, **kwargs)
+    conn.executescript(_PRAGMAS)
+    return conn
+
+def _open_in_memory(path):
+    """Copy an on-disk database into a private in-memory connection"""
+    mem = _open(":memory:", check_same_thread=False)
+    # Read-write without create: a missing file raises instead of being
+    # created empty, and as the only connection it can checkpoint the WAL
+    # and remove the -wal/-shm files when it closes (a mode=ro one cannot)
+    src = sqlite3.connect(f"file:{path}?mode=rw", uri=True)
+    src.backup(mem)
+    src.close()
+    return mem
+
+class _ConnectionPool:
+    """One writer connection plus a queue of reader connections for a database"""
+
+    def __init__(self, writer, readers):
+        self.writer = writer
+        self._connections = [writer, *readers]
+        self._readers = queue.Queue()
+        for conn in readers:
+            self._readers.put(conn)
+
+    @contextlib.contextmanager
+    def reader(self):
+        """Borrow a reader connection, returning it to the pool afterwards"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self):
+        # The writer closes last: only a read-write connection can checkpoint
+        # the WAL and remove the -wal/-shm files when the database is released
+        for conn in reversed(self._connections):
+            conn.close()
+
+# Read-only connections per database; under WAL they proceed alongside the
+# single writer, so concurrent tool calls never block on sample data writes
+_READER_COUNT = min(4, os.cpu_count() or 1)
+
+def _open_pool(path):
+    """Open a writer (created if missing) and a set of read-only connections"""
+    writer = _open(f"file:{path}?mode=rwc", uri=True, check_same_thread=False)
+    readers = [_open(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+               for _ in range(_READER_COUNT)]
+    return _ConnectionPool(writer, readers)
+
+def _open_in_memory_pool(path):
+    """Pool backed by one private in-memory copy, used for reads and writes"""
+    mem = _open_in_memory(path)
+    return _ConnectionPool(mem, [mem])
+
+# Connections per database, kept open and reused by every tool call and by
+# the sample data setup so page caches and parsed schemas survive between
+# calls. With AGENT_TEST_INMEMORY=1 each database is copied into memory
+# once, so the run does no disk I/O and leaves the .db files untouched.
+if os.getenv("AGENT_TEST_INMEMORY") == "1":
+    _POOLS = {
+        "orders.db": _open_in_memory_pool("orders.db"),
+        "inventory.db": _open_in_memory_pool("inventory.db")
+    }
+else:
+    _POOLS = {
+        "orders.db": _open_pool("orders.db"),
+        "inventory.db": _open_pool("inventory.db")
+    }
+atexit.register(lambda: [pool.close() for pool in _POOLS.values()])
+
+# Tool queries as module constants: every call passes the identical string,
+# so each one is a guaranteed hit in the connection's statement cache
+_SQL_ORDER = "SELECT id, status, order_date, total_amount FROM orders WHERE id = ?"
+_SQL_INV = "SELECT product_id, name, quantity, next_restock_date FROM inventory WHERE product_id = ?"
+
 @tool
 def check_order_status(order_id: str) -> dict:
     """Checks the current status of an order"""
-    conn = sqlite3.connect('orders.db')
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT id, status, order_date, total_amount
-        FROM orders WHERE id = ?
-    """, (order_id,))
-
-    result = cursor.fetchone()
-    conn.close()
+    with _POOLS["orders.db"].reader() as conn:
+        result = conn.execute(_SQL_ORDER, (order_id,)).fetchone()
 
     if result:
         return {
@@ -37,28 +123,24 @@ def check_order_status(order_id: str) -> dict:
         }
     return {"error": "Order not found"}
 
+# Return policies are fixed, so the table is built once at import
+_RETURN_POLICIES = {
+    "electronics": "30-day return window, must include original packaging",
+    "clothing": "60-day return window, must have tags attached",
+    "furniture": "14-day return window, assembly affects eligibility"
+}
+_DEFAULT_POLICY = "Standard 30-day return policy applies"
+
 @tool
 def check_return_policy(product_type: str) -> str:
     """Gets return policy for product type"""
-    policies = {
-        "electronics": "30-day return window, must include original packaging",
-        "clothing": "60-day return window, must have tags attached",
-        "furniture": "14-day return window, assembly affects eligibility"
-    }
-    return policies.get(product_type, "Standard 30-day return policy applies")
+    return _RETURN_POLICIES.get(product_type, _DEFAULT_POLICY)
 
 @tool
 def check_inventory(product_id: str) -> dict:
     """Checks if product is in stock"""
-    conn = sqlite3.connect('inventory.db')
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT product_id, name, quantity, next_restock_date
-        FROM inventory WHERE product_id = ?
-    """, (product_id,))
-
-    result = cursor.fetchone()
-    conn.close()
+    with _POOLS["inventory.db"].reader() as conn:
+        result = conn.execute(_SQL_INV, (product_id,)).fetchone()
 
     if result:
         return {
@@ -70,28 +152,34 @@ def check_inventory(product_id: str) -> dict:
         }
     return {"error": "Product not found"}
 
+def _insert_rows(conn, sql, rows):
+    """Insert all rows inside a single write transaction (one commit)"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(sql, rows)
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
 def setup_sample_data():
     """Add sample data to databases for testing"""
     try:
-        # Add sample order
-        conn = sqlite3.connect('orders.db')
-        cursor = conn.cursor()
-        cursor.execute('''
+        # Add sample orders
+        _insert_rows(_POOLS["orders.db"].writer, '''
             INSERT OR IGNORE INTO orders (customer_id, status, order_date, total_amount, shipping_address, billing_address, payment_method, notes, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (1, 'shipped', '2024-01-15', 299.99, '123 Main St, City, State 12345', '123 Main St, City, State 12345', 'Credit Card', 'Test order', '2024-01-10', '2024-01-15'))
-        conn.commit()
-        conn.close()
+        ''', [
+            (1, 'shipped', '2024-01-15', 299.99, '123 Main St, City, State 12345', '123 Main St, City, State 12345', 'Credit Card', 'Test order', '2024-01-10', '2024-01-15')
+        ])
 
         # Add sample inventory
-        conn = sqlite3.connect('inventory.db')
-        cursor = conn.cursor()
-        cursor.execute('''
+        _insert_rows(_POOLS["inventory.db"].writer, '''
             INSERT OR IGNORE INTO inventory (product_id, name, quantity, next_restock_date)
             VALUES (?, ?, ?, ?)
-        ''', ('PROD-XYZ', 'Wireless Headphones', 15, '2024-02-01'))
-        conn.commit()
-        conn.close()
+        ''', [
+            ('PROD-XYZ', 'Wireless Headphones', 15, '2024-02-01')
+        ])
 
         print("Sample data added successfully")
 
@@ -99,7 +187,12 @@ def setup_sample_data():
         print(f"Error setting up sample data: {e}")
 
 def test_tools():
-    """Test the agent tools with sample queries"""
+    """Test the agent tools with sample queries
+
+    Tests 1-3 call each tool through its LangChain wrapper to check the
+    wiring; the remaining input variations call the underlying function
+    (tool.func) directly to skip per-call schema validation and callbacks.
+    """
     print("\n" + "="*60)
     print("TESTING AGENT TOOLS STANDALONE")
     print("="*60)
@@ -148,7 +241,7 @@ def test_tools():
     # Test 4: Non-existent order
     print("\n--- Test 4: Non-existent Order ---")
     try:
-        result = check_order_status("999")
+        result = check_order_status.func("999")
         if "error" in result:
             print("[PASS] Non-existent order handled correctly")
         else:
@@ -159,7 +252,7 @@ def test_tools():
     # Test 5: Non-existent product
     print("\n--- Test 5: Non-existent Product ---")
     try:
-        result = check_inventory("NON-EXISTENT")
+        result = check_inventory.func("NON-EXISTENT")
         if "error" in result:
             print("[PASS] Non-existent product handled correctly")
         else:
@@ -170,9 +263,9 @@ def test_tools():
     # Test 6: Different product types for return policy
     print("\n--- Test 6: Return Policy Variations ---")
     try:
-        electronics_policy = check_return_policy("electronics")
-        clothing_policy = check_return_policy("clothing")
-        unknown_policy = check_return_policy("unknown")
+        electronics_policy = check_return_policy.func("electronics")
+        clothing_policy = check_return_policy.func("clothing")
+        unknown_policy = check_return_policy.func("unknown")
 
         if ("30-day" in electronics_policy and
             "60-day" in clothing_policy and